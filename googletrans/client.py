@@ -4,10 +4,15 @@ A Translation module.
 
 You can translate text using this module.
 """
+import asyncio
+import functools
 import random
 import typing
 import re
 import json
+import time
+from collections import OrderedDict
+from types import MappingProxyType
 
 import httpx_socks
 import httpx
@@ -18,19 +23,65 @@ from googletrans.gtoken import TokenAcquirer
 from googletrans.constants import (
     DEFAULT_CLIENT_SERVICE_URLS,
     DEFAULT_USER_AGENT, LANGCODES, LANGUAGES, SPECIAL_CASES,
-    DEFAULT_RAISE_EXCEPTION, DUMMY_DATA
+    DEFAULT_RAISE_EXCEPTION, DUMMY_DATA, DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL,
+    DEFAULT_CONCURRENCY
 )
 from googletrans.models import Translated, Detected, TranslatedPart, Translate_to_Detect, RateLimitError
 
 EXCLUDES = ('en', 'ca', 'fr')
 
+# position of each part of a gtx response and the key it gets in extra_data
+EXTRA_DATA_FIELDS = (
+    (0, 'translation'),
+    (1, 'all-translations'),
+    (2, 'original-language'),
+    (5, 'possible-translations'),
+    (6, 'confidence'),
+    (7, 'possible-mistakes'),
+    (8, 'language'),
+    (11, 'synonyms'),
+    (12, 'definitions'),
+    (13, 'examples'),
+    (14, 'see-also'),
+)
+
+# searched in the raw body, so rate-limited pages are never decoded to text
+RATE_LIMIT_MARKER = b'Our systems have detected unusual traffic from your computer network.'
+
 RPC_ID = 'MkEWBc'
+# a response chunk holding at least one answer to the RPC, not necessarily first
+RPC_FRAME_RE = re.compile(rb'^\[\s*\[.*?"wrb\.fr"\s*,\s*"' + RPC_ID.encode() + rb'"', re.MULTILINE)
+RPC_DECODER = json.JSONDecoder()
+RPC_BATCH_SIZE = 50
+# only the text has to be JSON-encoded: the languages are validated ASCII codes
+RPC_PAYLOAD_TEMPLATE = '[[{},"{}","{}",true],[null]]'
+RPC_REQUEST_TEMPLATE = '[[["' + RPC_ID + '",{},null,"generic"]]]'
+
+# lowercased language codes and names mapped to the code sent to Google, in the
+# same order of precedence as before: codes first, then special cases, then names
+LANG_NORMALIZE = dict(LANGCODES)
+LANG_NORMALIZE.update(SPECIAL_CASES)
+LANG_NORMALIZE.update((code.lower(), code) for code in LANGUAGES)
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+
+
+class NoLimit:
+    """Stand-in for :class:`asyncio.Semaphore` when concurrency is not limited"""
+
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *args):
+        return False
 
 
 class Translator:
     """Google Translate ajax API implementation class
 
-    You have to create an instance of Translator to use this API
+    You have to create an instance of Translator to use this API.
+    Each instance owns a pool of keep-alive connections, so create it once and
+    reuse it for every request instead of building a new one per call.
 
     :param service_urls: google translate url list. URLs will be used randomly.
                          For example ``['translate.google.com', 'translate.google.co.kr']``
@@ -48,33 +99,65 @@ class Translator:
     :param timeout: Definition of timeout for httpx library.
                     Will be used for every request.
     :type timeout: number or a double of numbers
+    :param limits: connection pool limits for httpx library.
+                   Every request goes to the same host, so ``max_connections`` bounds
+                   how many translations can be in flight at once.
+    :type limits: :class:`httpx.Limits`
+    :param concurrency: maximum number of requests sent to Google at the same time,
+                        for example while translating a list.
+                        Set to ``None`` or ``0`` to send requests without limit.
+    :type concurrency: :class:`int`
     :param proxy:  proxies configuration.
                     List mapping socks5 and http(s) host to the URL of the proxy
                     For example ``socks5://foo.bar:1080`` or ``https://foo.bar:8080``
     :param raise_exception: if `True` then raise exception if smth will go wrong
     :type raise_exception: boolean
+
+    :param cache_size: maximum number of results kept in the in-memory response cache.
+                       Set to ``0`` to disable caching.
+    :type cache_size: :class:`int`
+
+    :param cache_ttl: number of seconds a cached result stays valid.
+                      Set to ``None`` to keep entries until they are evicted.
+    :type cache_ttl: number
     """
 
+    _RPC_PARAMS = MappingProxyType({
+        'rpcids': RPC_ID,
+        'bl': 'boq_translate-webserver_20201207.13_p0',
+        'soc-app': 1,
+        'soc-platform': 1,
+        'soc-device': 1,
+        'rt': 'c',
+    })
+    # the body is sent already form-encoded, see utils.form_body
+    _RPC_HEADERS = MappingProxyType({
+        'Content-Type': 'application/x-www-form-urlencoded',
+    })
+
     def __init__(self, service_urls=DEFAULT_CLIENT_SERVICE_URLS, user_agent=DEFAULT_USER_AGENT,
                  raise_exception=DEFAULT_RAISE_EXCEPTION,
                  proxy: str = None,
                  timeout: Timeout = None,
-                 http2=True):
+                 http2=True,
+                 limits: httpx.Limits = DEFAULT_LIMITS,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 cache_size: int = DEFAULT_CACHE_SIZE,
+                 cache_ttl: float = DEFAULT_CACHE_TTL):
 
         transport = None
         
         if proxy is not None :
             if proxy.startswith('socks5'):
-                transport = httpx_socks.AsyncProxyTransport.from_url(proxy)
+                transport = httpx_socks.AsyncProxyTransport.from_url(proxy, limits=limits)
                 proxy = None
             else :
                 transport = None
                 
-        self.client = httpx.AsyncClient(http2=http2, transport=transport, proxy=proxy)
-
-        self.client.headers.update({
-            'User-Agent': user_agent,
-        })
+        # httpx already sends Accept-Encoding for every decoder it has (gzip, deflate,
+        # and br/zstd when installed), so only the User-Agent is set here
+        self.client = httpx.AsyncClient(http2=http2, transport=transport, proxy=proxy, limits=limits,
+                                        headers={'User-Agent': user_agent})
 
         if timeout is not None:
             self.client.timeout = timeout
@@ -87,69 +170,182 @@ class Translator:
                 client=self.client, host=self.service_urls[0])
 
             #if we have a service url pointing to client api we force the use of it as defaut client
-            for t in enumerate(service_urls):
-                api_type = re.search('googleapis',service_urls[0])
-                if (api_type):
-                    self.service_urls = ['translate.googleapis.com']
-                    self.client_type = 'gtx'
-                    break
+            if any('googleapis' in url for url in service_urls):
+                self.service_urls = ['translate.googleapis.com']
+                self.client_type = 'gtx'
         else:
             self.service_urls = ['translate.google.com']
             self.client_type = 'webapp'
             self.token_acquirer = TokenAcquirer(
                 client=self.client, host=self.service_urls[0])
+        self._single_url = self.service_urls[0] if len(self.service_urls) == 1 else None
+        # batchexecute is only served by the webapp hosts
+        self._rpc_urls = {
+            host: urls.TRANSLATE_RPC.format(host=host.replace('googleapis', 'google'))
+            for host in self.service_urls
+        }
         self.raise_exception = raise_exception
-    
+
+        if concurrency is not None and concurrency < 0:
+            raise ValueError('concurrency must be a positive number, 0 or None')
+        self.concurrency = concurrency
+        self._semaphore = None
+        self._semaphore_loop = None
+
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache = OrderedDict()
+        self._inflight = {}
+
+    async def close(self):
+        """Close the underlying HTTP client and its pooled connections"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def _get_semaphore(self):
+        # an asyncio.Semaphore is bound to one event loop, so it is rebuilt
+        # when the translator is reused from another one (e.g. asyncio.run())
+        loop = asyncio.get_event_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            if self.concurrency:
+                self._semaphore = asyncio.Semaphore(self.concurrency)
+            else:
+                self._semaphore = NoLimit()
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def cache_clear(self):
+        """Remove every entry from the response cache"""
+        self._cache.clear()
+
+    def _cache_get(self, key):
+        try:
+            expiry_ts, value = self._cache[key]
+        except KeyError:
+            return None
+
+        if expiry_ts is not None and expiry_ts < time.monotonic():
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return value
+
+    def _cache_set(self, key, value):
+        if self.cache_size <= 0:
+            return
+
+        expiry_ts = None
+        if self.cache_ttl is not None:
+            expiry_ts = time.monotonic() + self.cache_ttl
+
+        self._cache[key] = (expiry_ts, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _deduplicate(self, key, func, *args):
+        """Return the cached result for `key`, or run `func(*args)` once for
+        every concurrent caller asking for the same key.
+        """
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._inflight_done, key))
+
+        # a cancelled caller must not cancel the request shared with the others
+        return await asyncio.shield(task)
+
+    def _inflight_done(self, key, task):
+        del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        # a failed request answers with placeholder data, which must not be cached
+        result = task.result()
+        if result._response is not None and result._response.status_code == 200:
+            self._cache_set(key, result)
+
     @staticmethod
-    async def _build_rpc_request(text: str, dest: str, src: str):
-        return json.dumps([[
-            [
-                RPC_ID,
-                json.dumps([[text, src, dest, True], [None]], separators=(',', ':')),
-                None,
-                'generic',
-            ],
-        ]], separators=(',', ':'))
-
-    async def _pick_service_url(self):
-        if len(self.service_urls) == 1:
-            return self.service_urls[0]
-        return random.choice(self.service_urls)
-
-    async def _translate_to_detect(self, text: str, dest: str, src: str):
-        host = await self._pick_service_url()
-        url = urls.TRANSLATE_RPC.format(host=host.replace('googleapis', 'google'))
-        data = {
-            'f.req': await self._build_rpc_request(text, dest, src),
-        }
-        params = {
-            'rpcids': RPC_ID,
-            'bl': 'boq_translate-webserver_20201207.13_p0',
-            'soc-app': 1,
-            'soc-platform': 1,
-            'soc-device': 1,
-            'rt': 'c',
-        }
-        r = await self.client.post(url, params=params, data=data)
+    @functools.lru_cache(maxsize=1024)
+    def _build_rpc_request(text: str, dest: str, src: str):
+        inner = RPC_PAYLOAD_TEMPLATE.format(utils.json_dumps(text), src, dest)
+        return utils.form_body('f.req', RPC_REQUEST_TEMPLATE.format(utils.json_dumps(inner)))
+
+    @staticmethod
+    def _build_rpc_request_batch(texts, dest: str, src: str):
+        return utils.form_body('f.req', utils.json_dumps([[
+            [RPC_ID, RPC_PAYLOAD_TEMPLATE.format(utils.json_dumps(text), src, dest), None, str(index)]
+            for index, text in enumerate(texts, 1)
+        ]]))
+
+    @staticmethod
+    def _normalize_lang(code, allow_auto=False):
+        """Return the language code sent to Google for `code`, or None if unknown"""
+        code = code.lower().split('_', 1)[0]
+        if allow_auto and code == 'auto':
+            return code
+        return LANG_NORMALIZE.get(code)
+
+    def _normalize_langs(self, src, dest):
+        """Return the language codes sent to Google for `src` and `dest`"""
+        src_code = self._normalize_lang(src, allow_auto=True)
+        if src_code is None:
+            raise ValueError('invalid source language')
+
+        dest_code = self._normalize_lang(dest)
+        if dest_code is None:
+            raise ValueError('invalid destination language')
+
+        return src_code, dest_code
+
+    def _pick_service_url(self):
+        return self._single_url or random.choice(self.service_urls)
+
+    async def _translate_to_detect(self, text, dest: str, src: str):
+        url = self._rpc_urls[self._pick_service_url()]
+        if isinstance(text, list):
+            body = self._build_rpc_request_batch(text, dest, src)
+        else:
+            body = self._build_rpc_request(text, dest, src)
+        async with self._get_semaphore():
+            r = await self.client.post(url, params=self._RPC_PARAMS, content=body,
+                                       headers=self._RPC_HEADERS)
 
         if r.status_code != 200 and self.raise_exception:
             raise Exception('Unexpected status code "{}" from {}'.format(
                 r.status_code, self.service_urls))
 
-        return r.text, r
+        return r.content, r
 
     async def _translate(self, text, dest, src, override):
-        token = '' #dummy default value here as it is not used by api client
-        if self.client_type == 'webapp':
-            token = await self.token_acquirer.do(text)
+        async with self._get_semaphore():
+            token = '' #dummy default value here as it is not used by api client
+            if self.client_type == 'webapp':
+                token = self.token_acquirer.cached(text) or await self.token_acquirer.do(text)
 
-        params = await utils.build_params(client=self.client_type, query=text, src=src, dest=dest,
-                                    token=token, override=override)
+            params = utils.build_params(client=self.client_type, query=text, src=src, dest=dest,
+                                        token=token, override=override)
 
-        url = urls.TRANSLATE.format(host=await self._pick_service_url())
-        r = await self.client.get(url, params=params)
+            url = urls.TRANSLATE.format(host=self._pick_service_url())
+            r = await self.client.get(url, params=params)
 
         if r.status_code == 200:
+            # the gtx api answers with plain JSON, which can be decoded from bytes
+            if self.client_type == 'gtx':
+                try:
+                    return utils.json_loads(r.content), r
+                except ValueError:
+                    pass
             data = await utils.format_json(r.text)
             return data, r
 
@@ -161,27 +357,9 @@ class Translator:
         return DUMMY_DATA, r
 
     def _parse_extra_data(self, data):
-        response_parts_name_mapping = {
-            0: 'translation',
-            1: 'all-translations',
-            2: 'original-language',
-            5: 'possible-translations',
-            6: 'confidence',
-            7: 'possible-mistakes',
-            8: 'language',
-            11: 'synonyms',
-            12: 'definitions',
-            13: 'examples',
-            14: 'see-also',
-        }
-
-        extra = {}
-
-        for index, category in response_parts_name_mapping.items():
-            extra[category] = data[index] if (
-                index < len(data) and data[index]) else None
-
-        return extra
+        size = len(data)
+        return {category: data[index] if index < size and data[index] else None
+                for index, category in EXTRA_DATA_FIELDS}
 
     async def translate(self, text, dest='en', src='auto', **kwargs):
         """Translate text from source language to destination language
@@ -222,46 +400,51 @@ class Translator:
             jumps over  ->  이상 점프
             the lazy dog  ->  게으른 개
         """
-        src = src.lower().split('_', 1)[0]
+        src, dest = self._normalize_langs(src, dest)
 
-        if src != 'auto' and src not in LANGUAGES:
-            if src in SPECIAL_CASES:
-                src = SPECIAL_CASES[src]
-            elif src in LANGCODES:
-                src = LANGCODES[src]
-            else:
-                raise ValueError('invalid source language')
+        # languages are normalized once for the whole list
+        if isinstance(text, list):
+            return list(await asyncio.gather(
+                *(self._translate_cached(item, dest, src, kwargs) for item in text)))
 
-        if dest not in LANGUAGES:
-            if dest in SPECIAL_CASES:
-                dest = SPECIAL_CASES[dest]
-            elif dest in LANGCODES:
-                dest = LANGCODES[dest]
-            else:
-                raise ValueError('invalid destination language')
+        return await self._translate_cached(text, dest, src, kwargs)
 
-        if isinstance(text, list):
-            result = []
-            for item in text:
-                translated = await self.translate(item, dest=dest, src=src, **kwargs)
-                result.append(translated)
-            return result
+    async def _translate_cached(self, text, dest, src, override):
+        # extra query parameters may change the response, so only plain calls are cached
+        if override:
+            return await self._translate_one(text, dest, src, override)
+
+        return await self._deduplicate(('translate', text, src, dest),
+                                       self._translate_one, text, dest, src, override)
 
+    async def _translate_one(self, text, dest, src, override):
         origin = text
-        data, response = await self._translate(text, dest, src, kwargs)
+        data, response = await self._translate(text, dest, src, override)
 
         # this code will be updated when the format is changed.
-        translated = ''.join([d[0] if d[0] else '' for d in data[0]])
+        translated = ''.join(filter(None, (d[0] for d in data[0])))
 
         extra_data = self._parse_extra_data(data)
 
         # actual source language that will be recognized by Google Translator when the
-        # src passed is equal to auto.
-        try:
-            temp_src = await self.translate_to_detect(text)
-            src = temp_src.src#data[2]
-        except Exception:  # pragma: nocover
-            pass
+        # src passed is equal to auto. A failed request answers with placeholder
+        # data claiming 'en', so it is only read from a successful response.
+        if src == 'auto' and response.status_code == 200:
+            try:
+                src = data[8][0][0]
+            except Exception:  # pragma: nocover
+                pass
+            if src == 'auto':
+                try:
+                    src = data[2]
+                except Exception:  # pragma: nocover
+                    pass
+        if not src or src == 'auto':
+            try:
+                temp_src = await self.translate_to_detect(text)
+                src = temp_src.src
+            except Exception:  # pragma: nocover
+                pass
 
         pron = origin
         try:
@@ -287,71 +470,104 @@ class Translator:
         return result
 
     async def translate_to_detect(self, text: str, dest='en', src='auto'):
-        src = src.lower().split('_', 1)[0]
-
-        if src != 'auto' and src not in LANGUAGES:
-            if src in SPECIAL_CASES:
-                src = SPECIAL_CASES[src]
-            elif src in LANGCODES:
-                src = LANGCODES[src]
-            else:
-                raise ValueError('invalid source language')
-
-        if dest not in LANGUAGES:
-            if dest in SPECIAL_CASES:
-                dest = SPECIAL_CASES[dest]
-            elif dest in LANGCODES:
-                dest = LANGCODES[dest]
-            else:
-                raise ValueError('invalid destination language')
+        src, dest = self._normalize_langs(src, dest)
 
-        origin = text
+        if isinstance(text, list):
+            return await self._translate_to_detect_list(text, dest, src)
+
+        return await self._deduplicate(('translate_to_detect', text, src, dest),
+                                       self._translate_to_detect_one, text, dest, src)
+
+    async def _translate_to_detect_list(self, texts, dest, src):
+        results = [self._cache_get(('translate_to_detect', text, src, dest)) for text in texts]
+        # every distinct uncached text is sent once, even when it repeats in the list
+        missing = list(OrderedDict.fromkeys(
+            text for text, result in zip(texts, results) if result is None))
+
+        # batchexecute takes several RPC calls in one envelope, so the
+        # uncached texts are sent RPC_BATCH_SIZE at a time
+        batches = [missing[i:i + RPC_BATCH_SIZE] for i in range(0, len(missing), RPC_BATCH_SIZE)]
+        translated = await asyncio.gather(
+            *(self._translate_to_detect_batch(batch, dest, src) for batch in batches))
+
+        found = {}
+        for batch, batch_results in zip(batches, translated):
+            for text, result in zip(batch, batch_results):
+                found[text] = result
+                self._cache_set(('translate_to_detect', text, src, dest), result)
+
+        return [found[text] if result is None else result for text, result in zip(texts, results)]
+
+    async def _translate_to_detect_batch(self, texts, dest, src):
+        data, response = await self._translate_to_detect(texts, dest, src)
+        response = await self._check_rate_limit(response)
+
+        # every call of the envelope is answered by a frame carrying its request id;
+        # the frame order is only trusted when no frame carries an id at all
+        entries = list(self._decode_rpc_frames(data))
+        by_id = {entry[6]: entry for entry in entries if len(entry) > 6}
+        if not by_id and len(entries) == len(texts):
+            by_id = {str(index): entry for index, entry in enumerate(entries, 1)}
+
+        results = []
+        for index, text in enumerate(texts, 1):
+            entry = by_id.get(str(index))
+            if entry is None:
+                raise json.JSONDecodeError('RPC frame not found for request {} of the batch'.format(index),
+                                           data.decode('utf-8', 'replace'), 0)
+            results.append(self._parse_translate_to_detect(text, dest, src, entry[2], response))
+        return results
+
+    async def _translate_to_detect_one(self, text: str, dest: str, src: str):
+        payload, response = await self._request_rpc_payload(text, dest, src)
+        return self._parse_translate_to_detect(text, dest, src, payload, response)
+
+    async def _request_rpc_payload(self, text: str, dest: str, src: str):
         data, response = await self._translate_to_detect(text, dest, src)
+        response = await self._check_rate_limit(response)
 
-        token_found = False
-        square_bracket_counts = [0, 0]
-        resp = ''
-        for line in data.split('\n'):
-            token_found = token_found or f'"{RPC_ID}"' in line[:30]
-            if not token_found:
-                continue
-
-            is_in_string = False
-            for index, char in enumerate(line):
-                if char == '\"' and line[max(0, index - 1)] != '\\':
-                    is_in_string = not is_in_string
-                if not is_in_string:
-                    if char == '[':
-                        square_bracket_counts[0] += 1
-                    elif char == ']':
-                        square_bracket_counts[1] += 1
-
-            resp += line
-            if square_bracket_counts[0] == square_bracket_counts[1]:
-                break
+        # only the first frame matters; the frames that follow it are ignored
+        entry = next(self._decode_rpc_frames(data), None)
+        if entry is None:
+            raise json.JSONDecodeError('RPC frame not found', data.decode('utf-8', 'replace'), 0)
+        return entry[2], response
 
+    async def _check_rate_limit(self, response):
         if response.status_code == 302:
-            response = await self.client.request(response.request.method, response.request.url, content=response.request.content, headers=response.request.headers, follow_redirects=True)
-            if "Our systems have detected unusual traffic from your computer network." in response.text:
+            async with self._get_semaphore():
+                response = await self.client.request(response.request.method, response.request.url, content=response.request.content, headers=response.request.headers, follow_redirects=True)
+            if RATE_LIMIT_MARKER in response.content:
                 raise RateLimitError
-                
-        data = json.loads(resp)
-        parsed = json.loads(data[0][2])
+        return response
+
+    @staticmethod
+    def _decode_rpc_frames(data):
+        """Yield every answer to the RPC found in a batchexecute response"""
+        for frame in RPC_FRAME_RE.finditer(data):
+            start = frame.start()
+            end = data.find(b'\n', start)
+            try:
+                decoded = utils.json_loads(data[start:end] if end != -1 else data[start:])
+            except ValueError:
+                # the frame is spread over several lines, decode it up to its end
+                decoded, _ = RPC_DECODER.raw_decode(data[start:].decode('utf-8'))
+            # one chunk may hold several answers next to other entries
+            for entry in decoded:
+                if isinstance(entry, list) and len(entry) > 2 and \
+                        entry[0] == 'wrb.fr' and entry[1] == RPC_ID:
+                    yield entry
+
+    def _parse_translate_to_detect(self, text, dest, src, payload, response):
+        origin = text
+        parsed = utils.json_loads(payload)
         # not sure
         should_spacing = parsed[1][0][0][3]
-        translated_parts = list(map(lambda part: TranslatedPart(part[0], part[1] if len(part) >= 2 else []), parsed[1][0][0][5]))
-        translated = (' ' if should_spacing else '').join(map(lambda part: part.text, translated_parts))
+        translated_parts = [TranslatedPart(part[0], part[1] if len(part) >= 2 else [])
+                            for part in parsed[1][0][0][5]]
+        translated = (' ' if should_spacing else '').join(part.text or '' for part in translated_parts)
 
         if src == 'auto':
-            try:
-                src = parsed[2]
-            except:
-                pass
-        if src == 'auto':
-            try:
-                src = parsed[0][2]
-            except:
-                pass
+            src = self._parse_source_language(parsed)
 
         # currently not available
         confidence = None
@@ -381,9 +597,29 @@ class Translator:
                             response=response)
         return result
 
+    @staticmethod
+    def _parse_source_language(parsed):
+        src = 'auto'
+        try:
+            src = parsed[2]
+        except:
+            pass
+        if src == 'auto':
+            try:
+                src = parsed[0][2]
+            except:
+                pass
+        return src
+
     async def detect(self, text: str):
-        translated = await self.translate_to_detect(text, src='auto', dest='en')
-        result = Detected(lang=translated.src, confidence=translated.extra_data.get('confidence', None), response=translated._response)
+        return await self._deduplicate(('detect', text), self._detect_one, text)
+
+    async def _detect_one(self, text: str):
+        # only the detected language is read, the translation itself is not parsed
+        payload, response = await self._request_rpc_payload(text, 'en', 'auto')
+        lang = self._parse_source_language(utils.json_loads(payload))
+        # confidence is currently not available from this endpoint
+        result = Detected(lang=lang, confidence=None, response=response)
         return result
 
     async def detect_legacy(self, text, **kwargs):
@@ -418,11 +654,7 @@ class Translator:
             fr 0.043500196
         """
         if isinstance(text, list):
-            result = []
-            for item in text:
-                lang = await self.detect_legacy(item)
-                result.append(lang)
-            return result
+            return list(await asyncio.gather(*(self.detect_legacy(item) for item in text)))
 
         data, response = await self._translate(text, 'en', 'auto', kwargs)
 
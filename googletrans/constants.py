@@ -598,5 +598,8 @@ LANGNAMES = list(LANGUAGES.values())
 
 LANGCODES = dict(map(reversed, LANGUAGES.items()))
 DEFAULT_RAISE_EXCEPTION = False
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 3600
+DEFAULT_CONCURRENCY = 8
 DUMMY_DATA = [[["", None, None, 0]], None, "en", None,
               None, None, 1, None, [["en"], None, [1], ["en"]]]
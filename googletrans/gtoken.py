@@ -3,6 +3,7 @@ import ast
 import math
 import re
 import time
+from collections import OrderedDict
 
 import httpx
 
@@ -38,24 +39,49 @@ class TokenAcquirer:
     RE_TKK = re.compile(r'tkk:\'(.+?)\'', re.DOTALL)
     RE_RAWTKK = re.compile(r'tkk:\'(.+?)\'', re.DOTALL)
 
+    CACHE_SIZE = 1024
+
+    # tkk values fetched by any acquirer, shared per host as (tkk, fetched at)
+    TKK_TTL = 3600
+    _TKK_CACHE = {}
+
     def __init__(self, client: httpx.AsyncClient, tkk='0', host='translate.google.com'):
         self.client = client
         self.tkk = tkk
         self.host = host if 'http' in host else 'https://' + host
+        self._cache = OrderedDict()
+
+    def _is_valid(self):
+        now = math.floor(int(time.time() * 1000) / 3600000.0)
+        if self.tkk and int(self.tkk.split('.')[0]) == now:
+            return True
+
+        shared = self._TKK_CACHE.get(self.host)
+        return shared is not None and shared[0] == self.tkk and \
+            time.monotonic() - shared[1] < self.TKK_TTL
+
+    def _set_tkk(self, tkk):
+        self.tkk = tkk
+        self._TKK_CACHE[self.host] = (tkk, time.monotonic())
 
     async def _update(self):
         """update tkk
         """
         # we don't need to update the base TKK value when it is still valid
-        now = math.floor(int(time.time() * 1000) / 3600000.0)
-        if self.tkk and int(self.tkk.split('.')[0]) == now:
+        if self._is_valid():
+            return
+
+        # another acquirer for the same host may have fetched it recently
+        shared = self._TKK_CACHE.get(self.host)
+        if shared is not None and time.monotonic() - shared[1] < self.TKK_TTL:
+            self.tkk = shared[0]
             return
 
         r = await self.client.get(self.host)
 
         raw_tkk = self.RE_TKK.search(r.text)
         if raw_tkk:
-            self.tkk = raw_tkk.group(1)
+            self._set_tkk(raw_tkk.group(1))
             return
 
         try:
@@ -108,7 +134,7 @@ class TokenAcquirer:
             value = eval(clause, dict(__builtin__={}))
             result = '{}.{}'.format(n, value)
 
-            self.tkk = result
+            self._set_tkk(result)
 
     async def _lazy(self, value):
         """like lazy evaluation, this method returns a lambda function that
@@ -196,7 +222,27 @@ class TokenAcquirer:
 
         return '{}.{}'.format(a, a ^ b)
 
+    def cached(self, text):
+        """Return the token already computed for `text` with the current tkk,
+        or None when it has to be computed by :meth:`do`.
+        """
+        # a token only stays valid for the tkk it was computed with
+        cached = self._cache.get(text)
+        if cached is None or cached[0] != self.tkk or not self._is_valid():
+            return None
+        self._cache.move_to_end(text)
+        return cached[1]
+
     async def do(self, text):
         await self._update()
+
+        tk = self.cached(text)
+        if tk is not None:
+            return tk
+
         tk = await self.acquire(text)
+        self._cache[text] = (self.tkk, tk)
+        self._cache.move_to_end(text)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
         return tk
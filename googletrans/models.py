@@ -41,6 +41,8 @@ class Translated(Base):
         )
 
 class TranslatedPart:
+    __slots__ = ('text', 'candidates')
+
     def __init__(self, text: str, candidates: List[str]):
         self.text = text
         self.candidates = candidates
@@ -105,7 +107,7 @@ class Translate_to_Detect(Base):
             'text': self.text,
             'pronunciation': self.pronunciation,
             'extra_data': self.extra_data,
-            'parts': list(map(lambda part: part.__dict__(), self.parts)),
+            'parts': [part.__dict__() for part in self.parts],
         }
 
 class Detected(Base):
@@ -1,9 +1,44 @@
 """A conversion module for googletrans"""
 import json
 import re
+from urllib.parse import quote_plus
 
+try:
+    import orjson
+except ImportError:  # pragma: nocover
+    orjson = None
 
-async def build_params(client,query, src, dest, token, override):
+
+if orjson is not None:
+    def json_dumps(obj):
+        """Encode `obj` as compact JSON text"""
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson refuses lone surrogates, which json escapes as \udXXX
+            return json.dumps(obj, separators=(',', ':'))
+
+    def json_loads(data):
+        """Decode JSON text or bytes"""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson refuses escaped lone surrogates that json accepts
+            return json.loads(data)
+else:  # pragma: nocover
+    def json_dumps(obj):
+        """Encode `obj` as compact JSON text"""
+        return json.dumps(obj, separators=(',', ':'))
+
+    json_loads = json.loads
+
+
+def form_body(key, value):
+    """Encode a single field as an application/x-www-form-urlencoded body"""
+    return (quote_plus(key) + '=' + quote_plus(value)).encode('ascii')
+
+
+def build_params(client,query, src, dest, token, override):
     params = {
         'client': client,
         'sl': src,
@@ -20,8 +55,7 @@ async def build_params(client,query, src, dest, token, override):
     }
 
     if override is not None:
-        async for key, value in get_items(override):
-            params[key] = value
+        params.update(override)
 
     return params
 
@@ -59,14 +93,9 @@ async def legacy_format_json(original):
     return converted
 
 
-async def get_items(dict_object):
-    for key in dict_object:
-        yield key, dict_object[key]
-
-
 async def format_json(original):
     try:
-        converted = json.loads(original)
+        converted = json_loads(original)
     except ValueError:
         converted = await legacy_format_json(original)
 
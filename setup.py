@@ -67,6 +67,9 @@ def install():
             'httpx-socks',
             'httpx-socks[asyncio]',
         ],
+        extras_require={
+            'orjson': ['orjson'],
+        },
         python_requires= '>=3.6',
         tests_require=[
             'pytest',